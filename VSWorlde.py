@@ -11,11 +11,36 @@ For a quick automated check: python3 VSWorlde.py --selftest
 """
 from __future__ import annotations
 import argparse
+import functools
+import itertools
+import mmap
+import pickle
 import random
+import re
 import sys
-from typing import List, Tuple
+import threading
+from typing import List, Sequence, Tuple
 import os
 
+# numpy is optional and only the batch, packed and mask helpers need it, so it
+# is imported on first use by `_numpy()` rather than on every start.
+np = None
+_np_tried = False
+
+
+def _numpy():
+    """Import numpy on first use and bind it to `np`; None when unavailable."""
+    global np, _np_tried
+    if not _np_tried:
+        _np_tried = True
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            np = numpy
+    return np
+
 # A curated small set of possible solutions (all lowercase, 5 letters).
 # This list is intentionally limited to avoid reproducing any proprietary list.
 SOLUTIONS = [
@@ -25,128 +50,604 @@ SOLUTIONS = [
     "dance", "eagle", "fable", "gamer", "hippo", "jazzy", "kayak", "linen"
 ]
 
-# An allowed guesses set — include the solutions plus some extras.
-ALLOWED = set(SOLUTIONS) | {
+# The built-in allowed guesses — the solutions plus some extras. `ALLOWED`
+# (below) extends these with words from the dictionaries on first use.
+_BASE_ALLOWED = set(SOLUTIONS) | {
     "about", "other", "which", "their", "there", "would", "these",
     "brown", "quick", "zebra", "vivid", "young", "quiet", "pound",
     "bound", "stony", "slope", "pride", "trace"
 }
 
 
-def _augment_from_system_dict():
-    """Try to augment `ALLOWED` with 5-letter words from common system dictionaries.
+# Where the filtered words from the dictionaries below are cached between runs.
+_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "vsworlde",
+    "allowed.pkl",
+)
+# Bump when the word filter changes so caches built by older versions are ignored.
+_CACHE_VERSION = 2
+
+_DICT_PATHS = [
+    "/usr/share/dict/words",
+    "/usr/dict/words",
+    "/usr/dict/web2",
+    "/usr/share/dict/web2",
+]
+
+
+# One 5-letter ASCII word per line, tolerating surrounding blanks and CRLF endings.
+_WORD_LINE_RE = re.compile(rb"(?m)^[ \t]*([A-Za-z]{5})[ \t\r]*$")
+
+
+_WORDLIST_DIR = os.path.join(os.path.dirname(__file__), "wordlists")
+# The text lists in `wordlists` prebuilt into fixed-width 5-byte ASCII records
+# (no separators); see `_build_packed_wordlist`.
+_PACKED_PATH = os.path.join(_WORDLIST_DIR, "allowed.bin")
+# Records the text lists `_PACKED_PATH` was built from, one
+# "<name> <size> <sha256>" line each; the packed file is only used while
+# this still matches the lists on disk.
+_PACKED_SOURCES_PATH = os.path.join(_WORDLIST_DIR, "allowed.sources")
+_PACKED_RECORDS_RE = re.compile(r"(?:[a-z]{5})*")
+
+
+def _wordlist_paths() -> List[str]:
+    """Return the plain-text word lists in the project's `wordlists` folder."""
+    paths = []
+    if os.path.isdir(_WORDLIST_DIR):
+        for fname in sorted(os.listdir(_WORDLIST_DIR)):
+            fpath = os.path.join(_WORDLIST_DIR, fname)
+            if os.path.isfile(fpath) and fpath not in (_PACKED_PATH, _PACKED_SOURCES_PATH):
+                paths.append(fpath)
+    return paths
+
+
+def _source_paths(have_packed: bool) -> List[str]:
+    """Return the existing dictionary files `_augment_from_system_dict` scans.
+
+    Besides the system dictionaries, the text lists in the project's
+    `wordlists` folder are included unless `have_packed` says they were
+    loaded from an up-to-date `_PACKED_PATH`.
+    """
+    paths = [p for p in _DICT_PATHS if os.path.exists(p)]
+    if not have_packed:
+        paths.extend(_wordlist_paths())
+    return paths
+
+
+def _wordlist_record(paths: List[str]) -> str:
+    """Describe `paths` by name, size and content hash (see `_PACKED_SOURCES_PATH`)."""
+    import hashlib
+
+    lines = []
+    for p in paths:
+        try:
+            with open(p, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            # a list that vanished mid-listing is simply not part of the record
+            continue
+        lines.append(f"{os.path.basename(p)} {len(data)} {hashlib.sha256(data).hexdigest()}\n")
+    return "".join(lines)
+
+
+def _load_packed() -> set | None:
+    """Return the words stored in `_PACKED_PATH`.
+
+    Returns None when the file is missing or malformed, or when the text
+    lists in `wordlists` no longer match the ones it was built from; the
+    caller then scans those lists instead.
+    """
+    try:
+        with open(_PACKED_PATH, "rb") as fh:
+            buf = fh.read()
+        with open(_PACKED_SOURCES_PATH, encoding="utf-8") as fh:
+            built_from = fh.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if built_from != _wordlist_record(_wordlist_paths()):
+        return None
+    try:
+        text = buf.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    # Not a file we wrote; ignore it rather than misalign records or let
+    # non-letters reach the packed array.
+    if not _PACKED_RECORDS_RE.fullmatch(text):
+        return None
+    return {text[i:i + 5] for i in range(0, len(text), 5)}
+
+
+def _build_packed_wordlist() -> int:
+    """Write the words from the text lists in `wordlists` to `_PACKED_PATH`.
+
+    The lists used are recorded in `_PACKED_SOURCES_PATH`. Returns the
+    number of words written.
+    """
+    paths = _wordlist_paths()
+    words = set()
+    for p in paths:
+        words.update(_scan_file(p))
+    with open(_PACKED_PATH, "wb") as fh:
+        fh.write("".join(sorted(words)).encode("ascii"))
+    with open(_PACKED_SOURCES_PATH, "w", encoding="utf-8", newline="\n") as fh:
+        fh.write(_wordlist_record(paths))
+    return len(words)
+
+
+def _scan_file(path: str) -> set:
+    """Return the 5-letter words (lowercased) listed one per line in `path`.
+
+    The file is memory-mapped and matched with a single compiled regex, so
+    the per-line filtering runs inside the regex engine.
+    """
+    try:
+        with open(path, "rb") as fh:
+            try:
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return set()
+            with buf:
+                return {m.group(1).lower().decode("ascii") for m in _WORD_LINE_RE.finditer(buf)}
+    except OSError:
+        # ignore unreadable dictionaries
+        return set()
+
+
+def _fingerprint(paths: List[str]) -> tuple:
+    """Identify the current state of `paths` by mtime and size."""
+    fp = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        fp.append((p, st.st_mtime_ns, st.st_size))
+    return tuple(fp)
+
+
+def _load_cache(fp: tuple) -> frozenset | None:
+    """Return the cached words if they were built from the same sources."""
+    try:
+        with open(_CACHE_PATH, "rb") as fh:
+            cached = pickle.load(fh)
+    except Exception:
+        # a missing, truncated or stale-format cache is just a miss
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+        return None
+    if cached.get("fp") != fp:
+        return None
+    return cached.get("words")
+
+
+def _store_cache(fp: tuple, words: frozenset) -> None:
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        tmp = f"{_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump({"version": _CACHE_VERSION, "fp": fp, "words": words}, fh, protocol=5)
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        # caching is best-effort; a read-only home just means rescanning
+        pass
+
+
+def _augment_from_system_dict(allowed: set) -> None:
+    """Try to augment `allowed` with 5-letter words from common system dictionaries.
 
     This avoids shipping huge word lists in the repo while still giving a
     much larger set of allowed guesses when the system dictionary exists.
+    The prebuilt project list (`_PACKED_PATH`) is read without any parsing
+    while it matches the text lists it was built from. The words filtered from the other files are cached (see `_CACHE_PATH`)
+    keyed by the mtime and size of every source file, so later runs skip
+    the scan entirely.
     """
-    dict_paths = [
-        "/usr/share/dict/words",
-        "/usr/dict/words",
-        "/usr/dict/web2",
-        "/usr/share/dict/web2",
-    ]
-    found = False
-    for p in dict_paths:
-        if os.path.exists(p):
-            found = True
-            try:
-                with open(p, encoding="utf-8", errors="ignore") as fh:
-                    for line in fh:
-                        w = line.strip().lower()
-                        if len(w) == 5 and w.isalpha():
-                            ALLOWED.add(w)
-            except OSError:
-                # ignore unreadable system dicts
-                pass
-    # Also, if the project includes a `wordlists` folder with plain files,
-    # load any 5-letter words found there.
-    local_dir = os.path.join(os.path.dirname(__file__), "wordlists")
-    if os.path.isdir(local_dir):
-        for fname in os.listdir(local_dir):
-            fpath = os.path.join(local_dir, fname)
-            if os.path.isfile(fpath):
-                try:
-                    with open(fpath, encoding="utf-8", errors="ignore") as fh:
-                        for line in fh:
-                            w = line.strip().lower()
-                            if len(w) == 5 and w.isalpha():
-                                ALLOWED.add(w)
-                except OSError:
-                    pass
-
-
-# Attempt to augment allowed guesses from available dictionaries.
-_augment_from_system_dict()
+    packed = _load_packed()
+    if packed is not None:
+        allowed.update(packed)
+    paths = _source_paths(packed is not None)
+    fp = _fingerprint(paths)
+    cached = _load_cache(fp)
+    if cached is not None:
+        allowed.update(cached)
+        return
+
+    words = set()
+    if len(paths) == 1:
+        words.update(_scan_file(paths[0]))
+    elif paths:
+        # The files are independent and mostly I/O bound, so scan them in
+        # parallel. The pool is only needed on a cache miss, so import it here.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            words.update(itertools.chain.from_iterable(ex.map(_scan_file, paths)))
+
+    allowed.update(words)
+    _store_cache(fp, frozenset(words))
+
+
+# Maps each ASCII byte to its offset from "a", so "a".."z" become 0..25.
+_ENC = bytes.maketrans(bytes(range(256)), bytes((b - 97) & 0xFF for b in range(256)))
+
+
+def _encode_words(words: List[str]) -> "np.ndarray":
+    """Pack 5-letter lowercase words into a `uint8[N, 5]` array of 0..25 offsets."""
+    if _numpy() is None:
+        raise RuntimeError("_encode_words requires numpy")
+    buf = "".join(words).encode("ascii").translate(_ENC)
+    return np.frombuffer(buf, dtype=np.uint8).reshape(-1, 5)
+
+
+class _LazyAllowed:
+    """The allowed guesses, loaded from the dictionaries on first use.
+
+    Runs that never validate a guess (e.g. `--selftest`) skip the dictionary
+    load entirely. Once loaded, membership is a `frozenset` lookup; words are
+    interned so lookups of an interned guess compare by identity. Loading is
+    guarded by a lock so concurrent first lookups load exactly once.
+    """
+
+    def __init__(self, base: set) -> None:
+        self._base = base
+        self._lock = threading.Lock()
+        self._words: frozenset | None = None
+        self._list: List[str] = []
+        self._packed = None
+        self._masks = None
+
+    def _load(self) -> frozenset:
+        if self._words is None:
+            with self._lock:
+                if self._words is None:
+                    words = set(self._base)
+                    _augment_from_system_dict(words)
+                    self._list = sorted(sys.intern(w) for w in words)
+                    # published last: a non-None `_words` implies `_list` is set
+                    self._words = frozenset(self._list)
+        return self._words
+
+    def is_words(self, seq: object) -> bool:
+        """Whether `seq` is the loaded `words` list itself, without loading it."""
+        return self._words is not None and seq is self._list
+
+    def __contains__(self, word: object) -> bool:
+        return word in (self._words if self._words is not None else self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    @property
+    def words(self) -> List[str]:
+        """The allowed words in sorted order."""
+        self._load()
+        return self._list
+
+    @property
+    def packed(self) -> "np.ndarray | None":
+        """`words` as a `uint8[N, 5]` array of 0..25 letter offsets.
+
+        Row i is `words[i]`, so solver code can compare against the whole
+        list in one vectorized pass. Built on first access; None when numpy is
+        unavailable.
+        """
+        self._load()
+        if self._packed is None and _numpy() is not None:
+            with self._lock:
+                if self._packed is None:
+                    self._packed = _encode_words(self._list)
+        return self._packed
+
+    @property
+    def masks(self) -> "np.ndarray | None":
+        """`uint32[N]` letter-presence masks (see `letter_mask`) of `words`."""
+        packed = self.packed
+        if self._masks is None and packed is not None:
+            with self._lock:
+                if self._masks is None:
+                    # bit i of a word's mask is set when letter i occurs in it
+                    bits = np.left_shift(np.uint32(1), packed.astype(np.uint32))
+                    self._masks = np.bitwise_or.reduce(bits, axis=1)
+        return self._masks
+
+
+ALLOWED = _LazyAllowed(_BASE_ALLOWED)
 
 GREEN = "🟩"
 YELLOW = "🟨"
 BLACK = "⬛"
 
 
-def grade_guess(solution: str, guess: str) -> List[str]:
-    """
-    Return feedback per letter as a list of emoji strings.
+# Feedback for a whole guess is packed into one int: position i contributes
+# state * 3**i, with states 0 = BLACK, 1 = YELLOW, 2 = GREEN.
+_STATES = (BLACK, YELLOW, GREEN)
+_FB_TABLE = tuple(
+    "".join(_STATES[(code // 3 ** i) % 3] for i in range(5)) for code in range(3 ** 5)
+)
+_ALL_GREEN = 3 ** 5 - 1
 
-    Implements the standard counting algorithm used in word-guessing games
-    so duplicate letters are handled correctly.
-    """
+
+def _grade_code(solution: str, guess: str) -> int:
+    """Return feedback for `guess` packed as a base-3 int (see `_FB_TABLE`)."""
     solution = solution.lower()
     guess = guess.lower()
     if len(solution) != len(guess):
         raise ValueError("solution and guess must be same length")
+    if not (solution.isascii() and solution.isalpha() and guess.isascii() and guess.isalpha()):
+        raise ValueError("solution and guess must contain only letters a-z")
+    return _grade_cached(solution, guess)
+
 
-    feedback = [BLACK] * len(guess)
-    # Track letters in solution that haven't been matched as greens
-    remaining = {}
-    for i, ch in enumerate(solution):
-        if guess[i] == ch:
-            feedback[i] = GREEN
+@functools.lru_cache(maxsize=1 << 18)
+def _grade_cached(solution: str, guess: str) -> int:
+    """
+    Grade already-normalized words and return the base-3 feedback code.
+
+    Results are memoized: the grade depends only on the two words, and
+    callers pass them lowercased and validated, so each distinct pair has
+    exactly one cache entry.
+    """
+    return _grade_guess_fast(solution.encode("ascii"), guess.encode("ascii"))
+
+
+def _grade_guess_fast(sb: bytes, gb: bytes) -> int:
+    """
+    Grade lowercase ASCII words of equal length given as bytes.
+
+    Implements the standard counting algorithm used in word-guessing games
+    so duplicate letters are handled correctly. No validation is done here;
+    normalize at the call-site boundary instead (see `_grade_code`).
+    """
+    # Per-letter states (0 = BLACK, 1 = YELLOW, 2 = GREEN); emoji are only
+    # produced at the display boundary via `_STATES` / `_FB_TABLE`.
+    states = bytearray(len(gb))
+    # Track letters in solution that haven't been matched as greens,
+    # indexed by letter offset (a=0 .. z=25)
+    remaining = bytearray(26)
+    for i, b in enumerate(sb):
+        if gb[i] == b:
+            states[i] = 2
         else:
-            remaining[ch] = remaining.get(ch, 0) + 1
+            remaining[b - 97] += 1
 
     # Second pass: mark yellows where appropriate
-    for i, ch in enumerate(guess):
-        if feedback[i] == GREEN:
+    for i, b in enumerate(gb):
+        if states[i]:
             continue
-        if remaining.get(ch, 0) > 0:
-            feedback[i] = YELLOW
-            remaining[ch] -= 1
+        idx = b - 97
+        if remaining[idx]:
+            states[i] = 1
+            remaining[idx] -= 1
+
+    code = 0
+    for s in reversed(states):
+        code = code * 3 + s
+    return code
+
+
+def grade_guess(solution: str, guess: str) -> List[str]:
+    """Return feedback per letter as a list of emoji strings."""
+    code = _grade_code(solution, guess)
+    return [_STATES[(code // 3 ** i) % 3] for i in range(len(guess))]
 
-    return feedback
+
+def grade_guess_str(solution: str, guess: str) -> str:
+    """Return feedback for a guess as a single emoji string."""
+    if len(guess) != 5:
+        # `_FB_TABLE` only covers 5-letter codes
+        return "".join(grade_guess(solution, guess))
+    return _FB_TABLE[_grade_code(solution, guess)]
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_kernel():
+    """Return the numba-compiled batch grader, or None without numba.
+
+    numba is optional and slow to import, so this only happens the first time
+    a batch is graded.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # without numba, batches use plain numpy
+        return None
+
+    # Callers validate every offset (< 26) and the row width (5), so the
+    # kernel can skip bounds checks.
+    @njit(cache=True, boundscheck=False)
+    def _grade_core(sol, guess, out, cnt):
+        """Compiled two-pass grade of one encoded guess into `out` (0/1/2)."""
+        cnt[:] = 0
+        for i in range(5):
+            if guess[i] == sol[i]:
+                out[i] = 2
+            else:
+                out[i] = 0
+                cnt[sol[i]] += 1
+        for i in range(5):
+            if out[i] == 0 and cnt[guess[i]] > 0:
+                out[i] = 1
+                cnt[guess[i]] -= 1
+
+    @njit(cache=True, boundscheck=False)
+    def _grade_rows(sol, guesses, out):
+        cnt = np.zeros(26, np.uint8)
+        for r in range(guesses.shape[0]):
+            _grade_core(sol, guesses[r], out[r], cnt)
+
+    return _grade_rows
+
+
+def grade_guess_batch(solution: str, guesses: "np.ndarray") -> "np.ndarray":
+    """
+    Grade many guesses against one solution at once.
+
+    `guesses` is an integer `[N, 5]` array of 0..25 letter offsets, such as
+    the `uint8` arrays produced by `_encode_words`. Returns a `uint8[N, 5]`
+    array of per-letter states: 0 absent, 1 present, 2 correct.
+    Duplicate letters are handled exactly as in `grade_guess`. When numba is
+    installed the rows are graded by a compiled kernel, otherwise by
+    vectorized numpy operations.
+    """
+    if _numpy() is None:
+        raise RuntimeError("grade_guess_batch requires numpy")
+    solution = solution.lower()
+    if not _GUESS_RE.fullmatch(solution):
+        raise ValueError("solution must be a 5-letter word")
+    # Check the caller's array before casting, so out-of-range or fractional
+    # values raise instead of being wrapped or truncated into valid offsets.
+    guesses = np.asarray(guesses)
+    if guesses.ndim != 2 or guesses.shape[1] != 5 or guesses.dtype.kind not in "ui":
+        raise ValueError("guesses must be an integer [N, 5] array")
+    if guesses.size and (guesses.min() < 0 or guesses.max() >= 26):
+        raise ValueError("guesses must hold letter offsets 0..25")
+    guesses = np.ascontiguousarray(guesses, dtype=np.uint8)
+
+    sol = _encode_words([solution])[0]
+    n = guesses.shape[0]
+    kernel = _batch_kernel()
+    if kernel is not None:
+        out = np.empty((n, 5), dtype=np.uint8)
+        kernel(sol, guesses, out)
+        return out
+    return _grade_batch_numpy(sol, guesses)
+
+
+def _grade_batch_numpy(sol: "np.ndarray", guesses: "np.ndarray") -> "np.ndarray":
+    """Vectorized numpy version of the batch kernel, for validated inputs."""
+    n = guesses.shape[0]
+    rows = np.arange(n)
+
+    green = guesses == sol[None, :]
+    out = np.where(green, 2, 0).astype(np.uint8)
+
+    # Per-row counts of solution letters not already matched as greens
+    counts = np.zeros((n, 26), dtype=np.uint8)
+    r, c = np.nonzero(~green)
+    np.add.at(counts, (r, sol[c]), 1)
+
+    # Mark yellows column by column so earlier letters claim counts first
+    for col in range(5):
+        g = guesses[:, col]
+        hit = ~green[:, col] & (counts[rows, g] > 0)
+        out[hit, col] = 1
+        counts[rows[hit], g[hit]] -= 1
+
+    return out
+
+
+def grade_batch(solution: str, guesses: Sequence[str] | None = None) -> "np.ndarray":
+    """
+    Return feedback codes (see `_FB_TABLE`) for many guesses as an `int16[N]`.
+
+    With `guesses` omitted, every allowed word is graded and entry i
+    corresponds to `ALLOWED.words[i]`, reusing the prepacked `ALLOWED.packed`.
+    """
+    if _numpy() is None:
+        raise RuntimeError("grade_batch requires numpy")
+    # `is_words` avoids `ALLOWED.words`, which would load every dictionary
+    # just to grade a caller's own list.
+    if guesses is None or ALLOWED.is_words(guesses):
+        arr = ALLOWED.packed
+    else:
+        words = [g.lower() for g in guesses]
+        for w in words:
+            if not _GUESS_RE.fullmatch(w):
+                raise ValueError(f"guess {w!r} must be a 5-letter word")
+        arr = _encode_words(words)
+    states = grade_guess_batch(solution, arr)
+    return states.astype(np.int16) @ (3 ** np.arange(5, dtype=np.int16))
+
+
+_LETTERS_RE = re.compile(r"[a-z]*")
+
+
+def letter_mask(letters: str) -> int:
+    """Return a 26-bit mask with bit i set for each letter ("a" = bit 0) in `letters`."""
+    letters = letters.lower()
+    if not _LETTERS_RE.fullmatch(letters):
+        raise ValueError("letters must contain only letters a-z")
+    mask = 0
+    for b in letters.encode("ascii"):
+        mask |= 1 << (b - 97)
+    return mask
+
+
+def candidates(required_mask: int, forbidden_mask: int = 0) -> "np.ndarray":
+    """
+    Return indices into `ALLOWED.words` of words containing every letter in
+    `required_mask` and none in `forbidden_mask` (see `letter_mask`).
+
+    This is a cheap pre-filter for solvers before positional grading.
+    """
+    for name, m in (("required_mask", required_mask), ("forbidden_mask", forbidden_mask)):
+        if not 0 <= m < 1 << 26:
+            raise ValueError(f"{name} must be a 26-bit letter mask (see letter_mask)")
+    if _numpy() is None:
+        raise RuntimeError("candidates requires numpy")
+    masks = ALLOWED.masks
+    keep = ((masks & np.uint32(required_mask)) == required_mask) & ((masks & np.uint32(forbidden_mask)) == 0)
+    return np.nonzero(keep)[0]
+
+
+# What a well-formed guess (or solution) looks like once lowercased.
+_GUESS_RE = re.compile(r"[a-z]{5}")
+
+# Private generator for picking solutions, so seeding a game neither depends
+# on nor disturbs the global `random` state.
+_rng = random.Random()
 
 
 def play_interactive(solution: str | None = None) -> None:
-    solution = (solution or random.choice(SOLUTIONS)).lower()
-    length = len(solution)
+    solution = (solution or _rng.choice(SOLUTIONS)).lower()
+    if not _GUESS_RE.fullmatch(solution):
+        raise ValueError("solution must be a 5-letter word")
     max_guesses = 6
 
-    print("Welcome to VSWorlde — guess the 5-letter word!")
-    print(f"You have {max_guesses} guesses. Feedback: {GREEN}=correct, {YELLOW}=present, {BLACK}=absent")
+    sys.stdout.write(
+        "Welcome to VSWorlde — guess the 5-letter word!\n"
+        f"You have {max_guesses} guesses. Feedback: {GREEN}=correct, {YELLOW}=present, {BLACK}=absent\n"
+    )
+    sys.stdout.flush()
     # For debugging or test mode, the caller may pass solution explicitly.
     # (When playing normally, solution is not shown.)
 
     for attempt in range(1, max_guesses + 1):
         while True:
             guess = input(f"Guess {attempt}/{max_guesses}: ").strip().lower()
-            if len(guess) != length:
-                print(f"Please enter a {length}-letter word.")
+            # cheap check first so malformed input never reaches the set lookup
+            if not _GUESS_RE.fullmatch(guess):
+                print("Please enter a 5-letter word.")
                 continue
+            guess = sys.intern(guess)
             if guess not in ALLOWED:
                 print("Word not in allowed list. Try another word.")
                 continue
             break
 
-        feedback = grade_guess(solution, guess)
-        print("".join(feedback))
-        if all(s == GREEN for s in feedback):
-            print(f"Nice! You guessed the word in {attempt} guesses.")
+        # both words are already lowercase letters here, skip re-validation
+        code = _grade_cached(solution, guess)
+        # one write per turn: the feedback line plus the result, if any
+        out = _FB_TABLE[code] + "\n"
+        if code == _ALL_GREEN:
+            out += f"Nice! You guessed the word in {attempt} guesses.\n"
+        sys.stdout.write(out)
+        sys.stdout.flush()
+        if code == _ALL_GREEN:
             return
 
     print(f"Out of guesses — the word was: {solution}")
 
 
-def _selftest() -> None:
-    """Run a few deterministic checks on grading logic."""
+def _selftest(batch: bool = False) -> None:
+    """Run a few deterministic checks on grading logic.
+
+    With `batch`, also cross-check the numpy/numba batch graders.
+    """
     tests: List[Tuple[str, str, str]] = [
         ("apple", "apple", GREEN * 5),
         ("crane", "crate", GREEN + GREEN + GREEN + BLACK + GREEN),
@@ -154,16 +655,49 @@ def _selftest() -> None:
         ("sense", "seeds", GREEN + GREEN + YELLOW + BLACK + YELLOW),
     ]
 
+    def fail(sol: str, guess: str, expected: str, got: str, path: str) -> None:
+        print(f"Self-test failed ({path})")
+        print("Solution:", sol)
+        print("Guess:", guess)
+        print("Expected:", expected)
+        print("Got:     ", got)
+        sys.exit(2)
+
     for sol, guess, expected_str in tests:
-        fb = grade_guess(sol, guess)
-        got = "".join(fb)
-        if got != expected_str:
-            print("Self-test failed")
-            print("Solution:", sol)
-            print("Guess:", guess)
-            print("Expected:", expected_str)
-            print("Got:     ", got)
+        got = _grade_guess_fast(sol.encode("ascii"), guess.encode("ascii"))
+        if got != _FB_TABLE.index(expected_str):
+            fail(sol, guess, expected_str, _FB_TABLE[got], "_grade_guess_fast")
+        # the public API lowercases, validates and decodes to emoji
+        got_list = "".join(grade_guess(sol.upper(), guess))
+        if got_list != expected_str:
+            fail(sol, guess, expected_str, got_list, "grade_guess")
+        if grade_guess_str(sol, guess) != expected_str:
+            fail(sol, guess, expected_str, grade_guess_str(sol, guess), "grade_guess_str")
+
+    try:
+        grade_guess("crane", "cr4ne")
+    except ValueError:
+        pass
+    else:
+        print("Self-test failed: grade_guess accepted a non-letter guess")
+        sys.exit(2)
+
+    # The batch graders need numpy (and numba, when installed, compiles on
+    # first use), so they are only cross-checked on request.
+    if batch:
+        if _numpy() is None:
+            print("Self-test failed: --batch requires numpy")
             sys.exit(2)
+        for sol, guess, expected_str in tests:
+            expected = _grade_guess_fast(sol.encode("ascii"), guess.encode("ascii"))
+            got = int(grade_batch(sol, [guess])[0])
+            if got != expected:
+                fail(sol, guess, expected_str, _FB_TABLE[got], "grade_batch")
+            # also cover the plain numpy path, which numba would otherwise bypass
+            states = _grade_batch_numpy(_encode_words([sol])[0], _encode_words([guess]))
+            got = sum(int(v) * 3 ** i for i, v in enumerate(states[0]))
+            if got != expected:
+                fail(sol, guess, expected_str, _FB_TABLE[got], "_grade_batch_numpy")
 
     print("All self-tests passed.")
 
@@ -171,21 +705,36 @@ def _selftest() -> None:
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="VSWorlde")
     parser.add_argument("--selftest", action="store_true", help="run internal self-tests and exit")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="with --selftest, also check the numpy/numba batch graders (slower)",
+    )
     parser.add_argument("--word", type=str, help="force the solution word (for testing)")
     parser.add_argument("--seed", type=int, help="random seed for deterministic runs")
+    parser.add_argument(
+        "--build-wordlist",
+        action="store_true",
+        help="rebuild wordlists/allowed.bin from the text lists in wordlists/ and exit",
+    )
     args = parser.parse_args(argv)
 
+    if args.build_wordlist:
+        n = _build_packed_wordlist()
+        print(f"Wrote {n} words to {_PACKED_PATH}")
+        return 0
+
     if args.seed is not None:
-        random.seed(args.seed)
+        _rng.seed(args.seed)
 
     if args.selftest:
-        _selftest()
+        _selftest(args.batch)
         return 0
 
     forced = None
     if args.word:
         w = args.word.strip().lower()
-        if len(w) != 5:
+        if not _GUESS_RE.fullmatch(w):
             print("--word must be a 5-letter word")
             return 2
         forced = w